@@ -11,18 +11,43 @@ License: MIT
 Version: 1.1
 """
 
+from __future__ import annotations
+
 import argparse
+import codecs
+import contextlib
 import fnmatch
+import functools
 import json
+import mmap
+import operator
 import os
+import queue
 import re
 import shutil
 import subprocess
 import sys
-import tkinter as tk
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
-from tkinter import filedialog, ttk
-from typing import Any, Callable, List, Optional, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    cast,
+)
+
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import filedialog, ttk
+    from tkinter import font as tkfont
+
 
 
 # ==============================================================================
@@ -34,6 +59,16 @@ GUI_CHECKED_CHAR   = "✓"
 GUI_UNCHECKED_CHAR = "☐"
 FILE_ENCODINGS     = ["utf-8", "cp1252", "latin-1"]
 BUTTON_WIDTH       = 10
+HISTORY_SIZE       = 10
+FONT_FAMILY        = "Segoe UI" if os.name == "nt" else "Helvetica"
+FONT_SIZE          = 9 if os.name == "nt" else 10
+FONT_STYLE         = (FONT_FAMILY, FONT_SIZE)
+READ_WORKERS       = min(32, (os.cpu_count() or 1) * 4)
+READ_WINDOW        = READ_WORKERS * 2
+SPOOL_MAX_SIZE     = 64 << 20
+DECODE_CHUNK_SIZE  = 64 << 10
+PROGRESS_STEP      = 1.0
+PROGRESS_POLL_MS   = 33
 
 DEFAULT_EXTENSIONS = [
     ".py",
@@ -70,22 +105,47 @@ ERROR_MSG_MERGE   = f"{SEPARATOR_MARKER} ERROR:"
 END_ERROR_MERGE   = f"{SEPARATOR_MARKER} END ERROR:"
 
 # Split Regex Patterns
-def _create_split_pattern(marker):
-    """Creates a regex pattern for splitting content based on a marker.
+def _create_split_pattern(markers):
+    """Creates a bytes regex pattern matching marker lines in a whole bundle.
+
+    Lines may start after LF or CR and end before LF, CR or the end of the
+    bundle. The matched marker is captured in the 'kind' group and the rest
+    of the line in the 'path' group.
 
     Args:
-        marker: The marker string to look for.
+        markers: The marker strings to look for.
 
     Returns:
         re.Pattern: Compiled regex pattern.
     """
-    return re.compile(r"^(\S+)\s+" + re.escape(marker) + r"\s+(.+?)(?:\s*\*/)?$")
+    kinds = b"|".join(re.escape(marker.encode("utf-8")) for marker in markers)
+    return re.compile(
+        rb"(?:^|(?<=\r))[ \t]*\S+[ \t]+(?P<kind>" + kinds + rb")[ \t]+"
+        rb"(?P<path>[^\r\n]+?)(?:[ \t]*\*/)?[ \t]*(?=\r|\n|\Z)",
+        re.M,
+    )
 
-START_FILE_SPLIT  = _create_split_pattern(START_FILE_MERGE)
-END_FILE_SPLIT    = _create_split_pattern(END_FILE_MERGE)
-START_ERROR_SPLIT = _create_split_pattern(START_ERROR_MERGE)
-ERROR_MSG_SPLIT   = _create_split_pattern(ERROR_MSG_MERGE)
-END_ERROR_SPLIT   = _create_split_pattern(END_ERROR_MERGE)
+MARKER_SPLIT      = _create_split_pattern([
+    START_FILE_MERGE,
+    END_FILE_MERGE,
+    START_ERROR_MERGE,
+    ERROR_MSG_MERGE,
+    END_ERROR_MERGE])
+BLANK_LINES_SPLIT = re.compile(rb"(?:[ \t\f\v]*(?:\r\n|\r|\n))*")
+
+# Rich Text Markup
+RICH_TEXT_STYLES  = {
+    "b": "bold",
+    "i": "italic",
+    "u": "underline",
+    "red": "red",
+    "blue": "blue",
+    "green": "green"}
+RICH_TEXT_FONTS   = {
+    "bold": {"weight": "bold"},
+    "italic": {"slant": "italic"},
+    "underline": {"underline": True}}
+RICH_TEXT_MARKUP  = re.compile(r"<(?P<close>/?)(?P<name>b|i|u|red|blue|green)>")
 # fmt: on
 
 
@@ -110,20 +170,32 @@ def load_config() -> dict:
 def save_config(config: dict) -> None:
     """Saves configuration to the JSON file.
 
+    The file is machine-written, so it is stored compactly. It is written to
+    a temporary file first and then moved into place, so an interrupted save
+    never leaves a truncated configuration behind.
+
     Args:
         config: Configuration dictionary to save.
     """
+    temp_file = f"{CONFIG_FILE}.tmp"
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=4)
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(config, f, separators=(",", ":"))
+        os.replace(temp_file, CONFIG_FILE)
     except Exception:
-        pass
+        # Never leave a partial temporary file behind
+        with contextlib.suppress(OSError):
+            os.remove(temp_file)
 
 
 # ==============================================================================
 # File I/O Helpers
 
 
+# Printable ASCII plus the whitespace controls that are common in text
+_ASCII_TEXT_BYTES = b"\t\n\f\r" + bytes(range(0x20, 0x7F))
+
+
 def _is_binary_content(content: str) -> bool:
     """Checks if content appears to be binary based on control characters.
 
@@ -141,107 +213,210 @@ def _is_binary_content(content: str) -> bool:
 
     # Count non-printable characters (excluding common whitespace)
     # \t (9), \n (10), \r (13), \f (12) are common in text
-    text_controls = {9, 10, 12, 13}
-
-    non_printable_count = sum(
-        1 for c in sample if not c.isprintable() and ord(c) not in text_controls
-    )
+    if sample.isascii():
+        # Fast path: delete the text bytes in C and count what is left
+        non_printable_count = len(
+            sample.encode("ascii").translate(None, _ASCII_TEXT_BYTES)
+        )
+    else:
+        text_controls = {9, 10, 12, 13}
+        non_printable_count = sum(
+            1 for c in sample if not c.isprintable() and ord(c) not in text_controls
+        )
 
     # If more than 10% non-printable, consider it binary
     return (non_printable_count / len(sample)) > 0.10
 
 
-def _matches_filter(path: Path, filters: Optional[List[dict]]) -> bool:
-    """Checks if path matches any active filter rule.
+@functools.lru_cache(maxsize=32)
+def _compile_filters(rules: tuple) -> Optional[re.Pattern]:
+    """Compiles glob filter rules into a single regex.
+
+    Args:
+        rules: Tuple of active glob rules.
+
+    Returns:
+        Optional[re.Pattern]: Pattern matching one path part against any of
+            the rules, or None if there are no rules.
+    """
+    if not rules:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(rule)) for rule in rules)
+    )
+
+
+def _filter_pattern(filters: Optional[List[dict]]) -> Optional[re.Pattern]:
+    """Returns the compiled pattern for the active filter rules.
 
     Args:
-        path: The file path to check.
         filters: List of filter dictionaries.
 
     Returns:
-        bool: True if the path matches a filter, False otherwise.
+        Optional[re.Pattern]: Compiled pattern, or None if no rule is active.
     """
     if not filters:
-        return False
+        return None
 
+    rules = []
     for f in filters:
         if not f.get("active", True):
             continue
         rule = f.get("rule", "").strip()
-        if not rule:
-            continue
+        if rule:
+            rules.append(rule)
+    return _compile_filters(tuple(rules))
 
-        # Check if rule matches the filename or any part of the path
-        if fnmatch.fnmatch(path.name, rule) or any(
-            fnmatch.fnmatch(part, rule) for part in path.parts
-        ):
-            return True
-    return False
+
+def _matches_pattern(path: Path, pattern: Optional[re.Pattern]) -> bool:
+    """Checks if any part of path matches a compiled filter pattern.
+
+    Args:
+        path: The file path to check.
+        pattern: Pattern from _filter_pattern(), or None.
+
+    Returns:
+        bool: True if the path matches the pattern, False otherwise.
+    """
+    if pattern is None:
+        return False
+
+    # Check if any rule matches the filename or any part of the path
+    return any(pattern.match(os.path.normcase(part)) for part in path.parts)
+
+
+def _matches_filter(path: Path, filters: Optional[List[dict]]) -> bool:
+    """Checks if path matches any active filter rule.
+
+    Args:
+        path: The file path to check.
+        filters: List of filter dictionaries.
+
+    Returns:
+        bool: True if the path matches a filter, False otherwise.
+    """
+    return _matches_pattern(path, _filter_pattern(filters))
+
+
+def _extension_set(extensions: List[str]) -> frozenset:
+    """Normalizes extensions for suffix lookups.
+
+    Args:
+        extensions: List of file extensions, with or without the leading dot.
+
+    Returns:
+        frozenset: Lowercased extensions, each with a leading dot.
+    """
+    return frozenset(
+        (ext if ext.startswith(".") else "." + ext).lower() for ext in extensions
+    )
 
 
 def _collect_files(
-    source_path: Path, extensions: List[str], filters: Optional[List[dict]]
+    source_path: Path,
+    extensions: List[str],
+    filters: Optional[List[dict]],
+    inodes: Optional[dict] = None,
 ) -> List[Path]:
     """Collects files matching extensions and filters.
 
+    Walks the tree with os.scandir, pruning hidden directories before they
+    are entered and relying on the file type cached in each directory entry.
+
     Args:
         source_path: Root directory to scan.
         extensions: List of allowed file extensions.
         filters: List of filter dictionaries.
+        inodes: Optional dictionary that receives the inode number of each
+            matching file, as reported by the directory entry.
 
     Returns:
         List[Path]: List of matching file paths.
     """
+    ext_set = _extension_set(extensions)
+    filter_pattern = _filter_pattern(filters)
     matching_files = []
-    for file_path in source_path.rglob("*"):
-        if file_path.is_file() and not any(
-            part.startswith(".") for part in file_path.parts
-        ):
-            if _matches_filter(file_path, filters):
-                continue
+    stack = [str(source_path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                dot = name.rfind(".")
+                suffix = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+                if suffix not in ext_set:
+                    continue
 
-            if file_path.suffix.lower() in extensions:
-                matching_files.append(file_path)
+                file_path = Path(entry.path)
+                if not _matches_pattern(file_path, filter_pattern):
+                    matching_files.append(file_path)
+                    if inodes is not None:
+                        inodes[file_path] = entry.inode()
     return matching_files
 
 
-def _get_markers(suffix: str, rel_path: str) -> dict:
-    """Generates start, end, and error markers based on file extension.
+class _MarkerTemplates(NamedTuple):
+    """Pre-encoded marker templates for one comment syntax.
+
+    Each template takes the UTF-8 encoded display path via bytes %-formatting;
+    the error template takes the path, the message, and the path again.
+    """
+
+    start: bytes
+    end: bytes
+    error: bytes
+
+
+def _make_marker_templates(suffix: str) -> _MarkerTemplates:
+    """Builds start, end, and error marker templates for a file extension.
 
     Args:
         suffix: File extension (e.g., '.py').
-        rel_path: Relative path to display in markers.
 
     Returns:
-        dict: Dictionary containing marker strings.
+        _MarkerTemplates: Templates with a %b placeholder for the path.
     """
     comment_char = COMMENT_SYNTAX.get(suffix, "//")
-    is_css = suffix == ".css"
-
-    markers = {
-        "start": f"{comment_char} {START_FILE_MERGE} {rel_path}",
-        "end": f"{comment_char} {END_FILE_MERGE} {rel_path}",
-        "err_start": f"{comment_char} {START_ERROR_MERGE} {rel_path}",
-        "err_msg_prefix": f"{comment_char} {ERROR_MSG_MERGE}",
-        "err_end": f"{comment_char} {END_ERROR_MERGE} {rel_path}",
-        "err_msg_suffix": "",
-    }
+    closing = " */" if suffix == ".css" else ""
+
+    def line(marker: str, value: str = "%b") -> str:
+        return f"{comment_char} {marker} {value}{closing}\n"
+
+    return _MarkerTemplates(
+        start=line(START_FILE_MERGE).encode("utf-8"),
+        end=(line(END_FILE_MERGE) + "\n").encode("utf-8"),
+        error=(
+            line(START_ERROR_MERGE)
+            + line(ERROR_MSG_MERGE)
+            + line(END_ERROR_MERGE)
+            + "\n"
+        ).encode("utf-8"),
+    )
 
-    if is_css:
-        markers["start"] += " */"
-        markers["end"] += " */"
-        markers["err_start"] += " */"
-        markers["err_end"] += " */"
-        markers["err_msg_suffix"] = " */"
 
-    return markers
+MARKER_TEMPLATES = {suffix: _make_marker_templates(suffix) for suffix in COMMENT_SYNTAX}
+DEFAULT_MARKER_TEMPLATES = _make_marker_templates("")
 
 
-def _resolve_split_path(output_dir: str, original_path_str: str) -> Optional[Path]:
+def _resolve_split_path(base_path: str, original_path_str: str) -> Optional[Path]:
     """Resolves and sanitizes the output path for splitting.
 
     Args:
-        output_dir: Base output directory.
+        base_path: Absolute base output directory.
         original_path_str: Path string extracted from the bundle.
 
     Returns:
@@ -257,10 +432,12 @@ def _resolve_split_path(output_dir: str, original_path_str: str) -> Optional[Pat
             print(f"Skipping absolute path: {original_path_str}")
             return None
 
-        full_path = os.path.abspath(os.path.join(output_dir, rel_path_str))
-        base_path = os.path.abspath(output_dir)
+        full_path = os.path.abspath(os.path.join(base_path, rel_path_str))
 
-        if not os.path.commonpath([base_path, full_path]) == base_path:
+        # Plain prefix check: both paths are absolute and normalized
+        if not (
+            full_path == base_path or full_path.startswith(os.path.join(base_path, ""))
+        ):
             print(f"Skipping unsafe path: {original_path_str}")
             return None
 
@@ -270,91 +447,497 @@ def _resolve_split_path(output_dir: str, original_path_str: str) -> Optional[Pat
         return None
 
 
-def _handle_file_collision(target_path: Path, overwrite: bool) -> Path:
-    """Handles duplicate filenames by renaming or overwriting.
+def _open_split_target(target_path: Path, overwrite: bool, counters: dict) -> tuple:
+    """Opens the output file for a split entry, renaming on collisions.
+
+    New files are reserved atomically with O_CREAT | O_EXCL, so existence
+    checks and creation cannot race. The next rename number is remembered
+    per original path, so repeated duplicates do not probe taken names again.
 
     Args:
         target_path: The intended file path.
         overwrite: Whether to overwrite existing files.
+        counters: Next rename number per original path, shared across a split.
 
     Returns:
-        Path: The final path to write to (may be renamed).
+        tuple: (binary file object opened for writing, final path).
 
     Raises:
         RuntimeError: If too many duplicate files exist.
     """
-    if target_path.exists() and not (overwrite and target_path.is_file()):
-        stem = target_path.stem
-        suffix = target_path.suffix
-        counter = 1
-        max_duplicates = 10000
+    if overwrite and not target_path.is_dir():
+        return target_path.open("wb"), target_path
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    try:
+        return os.fdopen(os.open(target_path, flags, 0o666), "wb"), target_path
+    except FileExistsError:
+        pass
+
+    stem = target_path.stem
+    suffix = target_path.suffix
+    counter = counters.get(target_path, 1)
+    max_duplicates = 10000
 
-        while target_path.exists():
-            if counter > max_duplicates:
-                raise RuntimeError(f"Too many duplicate files for {stem}{suffix}")
-            target_path = target_path.with_name(f"{stem}_{counter}{suffix}")
-            counter += 1
-        print(f"Duplicate filename detected. Renamed to: {target_path.name}")
-    return target_path
+    while True:
+        if counter > max_duplicates:
+            raise RuntimeError(f"Too many duplicate files for {stem}{suffix}")
+        renamed_path = target_path.with_name(f"{stem}_{counter}{suffix}")
+        counter += 1
+        try:
+            fd = os.open(renamed_path, flags, 0o666)
+        except FileExistsError:
+            continue
+        counters[target_path] = counter
+        print(f"Duplicate filename detected. Renamed to: {renamed_path.name}")
+        return os.fdopen(fd, "wb"), renamed_path
 
 
-def _skip_error_section(lines: List[str], current_line: int) -> int:
-    """Skips lines until the end of an error block.
+def _map_file(file: Any) -> Any:
+    """Maps an open binary file read-only into memory.
 
     Args:
-        lines: List of all lines in the file.
-        current_line: Index of the current line.
+        file: File object opened in binary mode.
 
     Returns:
-        int: Index of the line after the error block.
+        Context manager yielding an mmap, or empty bytes for an empty file
+        (which cannot be mapped).
     """
-    error_line_count = 0
-    max_error_lines = 1000
+    if os.fstat(file.fileno()).st_size == 0:
+        return contextlib.nullcontext(b"")
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
 
-    while current_line < len(lines) and error_line_count < max_error_lines:
-        line_stripped = lines[current_line].strip()
-        if END_ERROR_SPLIT.match(line_stripped):
-            current_line += 1
-            while current_line < len(lines) and not lines[current_line].strip():
-                current_line += 1
-            return current_line
-        current_line += 1
-        error_line_count += 1
 
-    print("Warning: Error block exceeded max lines, skipping remaining content")
-    return current_line
+def _iter_split_markers(content: Any) -> Iterator[re.Match]:
+    """Yields the marker lines of a bundle in order.
 
+    The separator is located with a plain substring search first, so the
+    regex only runs on the few lines that can actually be markers.
 
-def read_file_content(file_path: Path) -> str:
-    """Attempts to read file content using multiple encodings.
+    Args:
+        content: Full bundle content as bytes or a memory map.
+
+    Yields:
+        re.Match: MARKER_SPLIT match for each marker line.
+    """
+    separator = SEPARATOR_MARKER.encode("utf-8")
+    pos = 0
+    while True:
+        index = content.find(separator, pos)
+        if index < 0:
+            return
+        line_start = content.rfind(b"\n", 0, index) + 1
+        line_start = max(line_start, content.rfind(b"\r", line_start, index) + 1)
+        match = MARKER_SPLIT.match(content, line_start)
+        if match:
+            yield match
+            pos = match.end()
+        else:
+            pos = index + len(separator)
+
+
+def _split_content(
+    content: Any,
+    base_path: str,
+    overwrite: bool,
+    filters: Optional[List[dict]],
+    progress_callback: Optional[Callable],
+) -> None:
+    """Writes the files contained in a bundle buffer.
 
     Args:
-        file_path: Path object pointing to the file to read.
+        content: Bundle content as bytes or a read-only memory map.
+        base_path: Absolute output directory.
+        overwrite: If True, overwrite existing files instead of renaming.
+        filters: List of filter rules to exclude files/directories.
+        progress_callback: Optional callback for progress updates (current, total).
+    """
+    total_bytes = len(content)
+    current_file = None
+    body_start = 0
+    # Directories known to exist, so each one is created at most once
+    created_dirs = set()
+    # Next rename number per colliding path
+    collision_counters: dict = {}
+    filter_pattern = _filter_pattern(filters)
+
+    def line_end(match: re.Match) -> int:
+        """Returns the index just past the line terminator of a marker line."""
+        end = match.end()
+        if content[end : end + 2] == b"\r\n":
+            return end + 2
+        return end + 1 if content[end : end + 1] in (b"\r", b"\n") else end
+
+    def flush_body(end: int) -> None:
+        """Writes the content between the last marker and end to the open file."""
+        if current_file and end > body_start:
+            current_file.write(content[body_start:end])
+
+    # Scan only marker lines; file content between them is written as slices
+    markers = _iter_split_markers(content)
+    for marker in markers:
+        kind = marker.group("kind").decode("utf-8")
+
+        if kind == START_FILE_MERGE:
+            if progress_callback:
+                progress_callback(marker.start(), total_bytes)
+
+            if current_file:
+                flush_body(marker.start())
+                current_file.close()
+                current_file = None
+
+            body_start = line_end(marker)
+            original_path_str = marker.group("path").decode("utf-8", "surrogateescape")
+            target_path = _resolve_split_path(base_path, original_path_str)
+
+            if target_path:
+                if _matches_pattern(target_path, filter_pattern):
+                    print(f"Skipping filtered path: {original_path_str}")
+                    continue
+
+                try:
+                    parent = target_path.parent
+                    if parent not in created_dirs:
+                        parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(parent)
+                        created_dirs.update(parent.parents)
+                    current_file, target_path = _open_split_target(
+                        target_path, overwrite, collision_counters
+                    )
+                except Exception as e:
+                    print(f"Error creating file {target_path}: {e}")
+                    current_file = None
+
+        elif kind == END_FILE_MERGE:
+            if current_file:
+                flush_body(marker.start())
+                current_file.close()
+                current_file = None
+
+        elif kind == START_ERROR_MERGE:
+            # Skip the whole error block
+            flush_body(marker.start())
+            for error_marker in markers:
+                if error_marker.group("kind").decode("utf-8") == END_ERROR_MERGE:
+                    body_start = BLANK_LINES_SPLIT.match(
+                        content, line_end(error_marker)
+                    ).end()
+                    break
+            else:
+                print(
+                    "Warning: Error block is not terminated, skipping remaining content"
+                )
+                body_start = total_bytes
+
+        elif kind == ERROR_MSG_MERGE:
+            # Skip error messages
+            flush_body(marker.start())
+            body_start = line_end(marker)
+
+    if current_file:
+        flush_body(total_bytes)
+        current_file.close()
+
+    if progress_callback:
+        progress_callback(total_bytes, total_bytes)
+
+
+def _decode_source(raw: bytes) -> str:
+    """Decodes file bytes using the first supported encoding that fits.
+
+    Args:
+        raw: File content as read from disk.
 
     Returns:
-        str: File content as string.
+        str: Decoded file content.
 
     Raises:
-        UnicodeDecodeError: If file cannot be decoded with supported encodings.
+        UnicodeDecodeError: If content cannot be decoded with supported encodings.
     """
     for encoding in FILE_ENCODINGS:
         try:
-            with file_path.open("r", encoding=encoding, newline="") as f:
-                content = f.read()
-                if _is_binary_content(content):
-                    raise ValueError("Binary content detected")
-                return content
-        except (UnicodeDecodeError, ValueError):
+            content = raw.decode(encoding)
+        except UnicodeDecodeError:
             continue
+        if not _is_binary_content(content):
+            return content
     raise UnicodeDecodeError(
         "utf-8", b"", 0, 1, "Failed to decode with supported encodings"
     )
 
 
+def read_file_content(file_path: Path) -> str:
+    """Attempts to read file content using multiple encodings.
+
+    Args:
+        file_path: Path object pointing to the file to read.
+
+    Returns:
+        str: File content as string.
+
+    Raises:
+        UnicodeDecodeError: If file cannot be decoded with supported encodings.
+    """
+    return _decode_source(file_path.read_bytes())
+
+
+def _is_utf8_text(raw: bytes) -> bool:
+    """Checks that bytes are UTF-8 text without decoding them in one piece.
+
+    The content is validated in DECODE_CHUNK_SIZE steps and the decoded
+    chunks are dropped, so no full-size string is ever built. The first
+    chunk always decodes to more than the 8KB sample the binary check needs.
+
+    Args:
+        raw: File content as read from disk.
+
+    Returns:
+        bool: True if the content is UTF-8 and not binary, False otherwise.
+
+    Raises:
+        UnicodeDecodeError: If the content is not valid UTF-8.
+    """
+    size = len(raw)
+    if size <= DECODE_CHUNK_SIZE:
+        return not _is_binary_content(raw.decode("utf-8"))
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(raw)
+    if _is_binary_content(decoder.decode(view[:DECODE_CHUNK_SIZE])):
+        return False
+    for start in range(DECODE_CHUNK_SIZE, size, DECODE_CHUNK_SIZE):
+        end = start + DECODE_CHUNK_SIZE
+        decoder.decode(view[start:end], end >= size)
+    return True
+
+
+def _read_source_bytes(file_path: Path) -> bytes:
+    """Reads a source file and returns its content as UTF-8 encoded bytes.
+
+    The file is read once. Valid UTF-8 files are passed through as read from
+    disk, so the common case needs no re-encoding. Files in a fallback
+    encoding are transcoded once.
+
+    Args:
+        file_path: Path object pointing to the file to read.
+
+    Returns:
+        bytes: File content encoded as UTF-8.
+
+    Raises:
+        UnicodeDecodeError: If file cannot be decoded with supported encodings.
+    """
+    raw = file_path.read_bytes()
+    try:
+        if _is_utf8_text(raw):
+            return raw
+    except UnicodeDecodeError:
+        pass
+    return _decode_source(raw).encode("utf-8")
+
+
+def _read_file_stats(file_path: Path) -> tuple:
+    """Reads a source file and computes its index statistics.
+
+    Never raises, so it can be mapped over files from worker threads.
+
+    Args:
+        file_path: Path object pointing to the file to read.
+
+    Returns:
+        tuple: (raw_bytes, size_str, lines, None) on success, or
+            (None, None, 0, exception) if the file could not be read.
+    """
+    try:
+        raw = _read_source_bytes(file_path)
+    except Exception as e:
+        return None, None, 0, e
+    # A trailing newline ends the last line rather than starting a new one
+    lines = raw.count(b"\n") + (0 if not raw or raw.endswith(b"\n") else 1)
+    return raw, f"{len(raw) / 1024:.1f}", lines, None
+
+
+def _copy_spool(spool: Any, outfile: Any) -> None:
+    """Appends the whole content of a spooled temporary file to outfile.
+
+    Once the spool has rolled over to disk, the data is moved with
+    os.sendfile so it never passes through user space. In-memory spools and
+    platforms without sendfile use a buffered copy.
+
+    Args:
+        spool: SpooledTemporaryFile positioned at its end.
+        outfile: Binary output file object.
+    """
+    size = spool.tell()
+    offset = 0
+    # A spool rolls over to a real file as soon as it grows past max_size
+    if size > SPOOL_MAX_SIZE and hasattr(os, "sendfile"):
+        outfile.flush()
+        try:
+            while offset < size:
+                sent = os.sendfile(
+                    outfile.fileno(), spool.fileno(), offset, size - offset
+                )
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            pass
+    spool.seek(offset)
+    shutil.copyfileobj(spool, outfile, 1 << 20)
+
+
+def _iter_file_stats(
+    paths: List[Path], inodes: Optional[dict] = None
+) -> Iterator[tuple]:
+    """Reads files in parallel and yields their statistics in input order.
+
+    Files are submitted in batches of READ_WINDOW, and at most two batches
+    are in flight or waiting to be consumed, so memory stays bounded. Within
+    a batch, reads are issued in inode order when inodes are known, which
+    keeps disk access closer to sequential than path order.
+
+    Args:
+        paths: Files to read, in the order results are wanted.
+        inodes: Optional mapping of file paths to inode numbers.
+
+    Yields:
+        tuple: _read_file_stats() result for each path.
+    """
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        pending = deque()
+        for start in range(0, len(paths), READ_WINDOW):
+            batch = paths[start : start + READ_WINDOW]
+            order = range(len(batch))
+            if inodes:
+                order = sorted(order, key=lambda i: inodes.get(batch[i], 0))
+            futures = [None] * len(batch)
+            for i in order:
+                futures[i] = executor.submit(_read_file_stats, batch[i])
+            pending.append(futures)
+            if len(pending) > 1:
+                for future in pending.popleft():
+                    yield future.result()
+        while pending:
+            for future in pending.popleft():
+                yield future.result()
+
+
 # ==============================================================================
 # Core Logic Functions
 
 
+def _write_bundle(
+    output_path: Path,
+    file_entries: List[tuple],
+    progress_callback: Optional[Callable] = None,
+    inodes: Optional[dict] = None,
+) -> int:
+    """Writes the file index and the marked file contents to the bundle.
+
+    The output is written in binary mode: file contents are kept as UTF-8
+    bytes from read to write, and markers are encoded once per line. File
+    sections go to a spooled temporary file (in memory up to SPOOL_MAX_SIZE)
+    while the index statistics are collected.
+
+    Args:
+        output_path: Path to the output combined file.
+        file_entries: List of (file_path, display_path) tuples, in bundle order.
+        progress_callback: Optional callback for progress updates (current, total).
+        inodes: Optional mapping of file paths to inode numbers, used to order
+            the parallel reads.
+
+    Returns:
+        int: Estimated number of tokens for the bundled content.
+    """
+    total_files = len(file_entries)
+
+    # Determine bundle comment syntax
+    bundle_suffix = output_path.suffix.lower()
+    bundle_comment_char = COMMENT_SYNTAX.get(bundle_suffix, "#")
+    is_css_bundle = bundle_suffix == ".css"
+
+    # Single pass: files are read in parallel and their marked sections are
+    # spooled right away, so only the index statistics stay in memory. The
+    # index is written in front of the spooled body once they are known.
+    index_stats = []
+    max_size_len = 0
+    max_lines_len = 0
+    paths = [file_path for file_path, _ in file_entries]
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as body:
+        results = _iter_file_stats(paths, inodes)
+        for index, ((file_path, display_path), result) in enumerate(
+            zip(file_entries, results), 1
+        ):
+            raw, size_str, lines, error = result
+            templates = MARKER_TEMPLATES.get(
+                file_path.suffix.lower(), DEFAULT_MARKER_TEMPLATES
+            )
+            path_bytes = display_path.encode("utf-8")
+
+            # Each file section is assembled and written with a single call
+            if error is None:
+                max_size_len = max(max_size_len, len(size_str))
+                max_lines_len = max(max_lines_len, len(str(lines)))
+                body_parts = [templates.start % path_bytes, raw]
+                if raw and not raw.endswith((b"\n", b"\r")):
+                    body_parts.append(b"\n")
+                body_parts.append(templates.end % path_bytes)
+            else:
+                error_msg = (
+                    "Cannot read file (binary or unsupported encoding)"
+                    if isinstance(error, UnicodeDecodeError)
+                    else str(error)
+                )
+                body_parts = [
+                    templates.start % path_bytes,
+                    templates.error
+                    % (path_bytes, error_msg.encode("utf-8"), path_bytes),
+                ]
+
+            body.write(b"".join(body_parts))
+            index_stats.append((display_path, size_str, lines, error))
+
+            if progress_callback:
+                progress_callback(index, total_files)
+
+        # Calculate max path length for alignment
+        max_path_len = max((len(dp) for _, dp in file_entries), default=0)
+        total_bytes = body.tell()
+
+        with open(output_path, "wb", buffering=1 << 20) as outfile:
+            if total_files > 0:
+                # Build the File Index in memory and write it in a single call
+                index_end = " */\n" if is_css_bundle else "\n"
+                index_parts = [
+                    f"{bundle_comment_char} {START_FILE_INDEX}{index_end}",
+                    f"{bundle_comment_char} Total Files: {total_files}{index_end}",
+                    f"{bundle_comment_char} {index_end}",
+                ]
+                # Row templates are built once with the column widths baked in
+                row_format = f"{bundle_comment_char} {{:<{max_path_len}}} | SIZE: {{:>{max_size_len}}}kb | LINES: {{:>{max_lines_len}}}{index_end}".format
+                error_row_format = f"{bundle_comment_char} {{:<{max_path_len}}} [Error reading file]{index_end}".format
+                index_parts.extend(
+                    (
+                        row_format(display_path, size_str, lines)
+                        if error is None
+                        else error_row_format(display_path)
+                    )
+                    for display_path, size_str, lines, error in index_stats
+                )
+                index_parts.append(f"{bundle_comment_char} {END_FILE_INDEX}{index_end}")
+                index_parts.append("\n")
+
+                data = "".join(index_parts).encode("utf-8")
+                outfile.write(data)
+                total_bytes += len(data)
+
+            _copy_spool(body, outfile)
+
+    return total_bytes // 4
+
+
 def merge_source_files(
     source_files: List[str],
     output_file: str,
@@ -378,6 +961,8 @@ def merge_source_files(
         extensions = []  # Empty list means accept all extensions
 
     output_path = Path(output_file)
+    ext_set = _extension_set(extensions)
+    filter_pattern = _filter_pattern(filters)
 
     # Filter files by extension and filters
     valid_files = []
@@ -390,16 +975,12 @@ def merge_source_files(
             continue
 
         # Check extension (only if extensions are specified and not empty)
-        if (
-            extensions is not None
-            and extensions
-            and file_path.suffix.lower() not in extensions
-        ):
+        if ext_set and file_path.suffix.lower() not in ext_set:
             wrong_extension_files.append(str(file_path))
             continue
 
         # Check filters (only if filters are specified and not empty)
-        if filters is not None and filters and _matches_filter(file_path, filters):
+        if _matches_pattern(file_path, filter_pattern):
             filtered_files.append(str(file_path))
             continue
 
@@ -423,124 +1004,17 @@ def merge_source_files(
             error_msg = "No files selected."
         raise ValueError(error_msg)
 
-    # Pre-read files to generate index statistics and cache content
-    content_cache = {}
-    max_size_len = 0
-    max_lines_len = 0
-
-    for file_path in valid_files:
-        try:
-            content = read_file_content(file_path)
-            size_kb = len(content.encode("utf-8")) / 1024
-            lines = content.count("\n") + 1
-            size_str = f"{size_kb:.1f}"
-            content_cache[file_path] = (content, size_str, lines, None)
-            max_size_len = max(max_size_len, len(size_str))
-            max_lines_len = max(max_lines_len, len(str(lines)))
-        except Exception as e:
-            content_cache[file_path] = (None, None, 0, e)
-
-    # Determine bundle comment syntax
-    bundle_suffix = output_path.suffix.lower()
-    bundle_comment_char = COMMENT_SYNTAX.get(bundle_suffix, "#")
-    is_css_bundle = bundle_suffix == ".css"
-    total_chars = 0
-
-    with output_path.open("w", encoding="utf-8", newline="") as outfile:
-        if total_files > 0:
-            # Write File Index
-            def write_index_line(text: str):
-                """Writes a line to the index section with appropriate comments."""
-                nonlocal total_chars
-                line = ""
-                if is_css_bundle:
-                    line = f"{bundle_comment_char} {text} */\n"
-                else:
-                    line = f"{bundle_comment_char} {text}\n"
-                outfile.write(line)
-                total_chars += len(line)
-
-            write_index_line(START_FILE_INDEX)
-            write_index_line(f"Total Files: {total_files}")
-            write_index_line("")
-
-            # Calculate max path length for alignment
-            # In Source Files Mode (extensions is empty list), use relative paths
-            if extensions == []:
-                # Source Files Mode: calculate relative paths from common base
-                # Find common base path of all selected files
-                if valid_files:
-                    common_path = os.path.commonpath([str(fp) for fp in valid_files])
-                    display_paths = []
-                    for fp in valid_files:
-                        # Calculate relative path from common base
-                        rel_path = os.path.relpath(str(fp), common_path)
-                        display_paths.append(rel_path)
-                else:
-                    display_paths = []
-            else:
-                # Directory Mode: use full paths
-                display_paths = [str(fp) for fp in valid_files]
-
-            max_path_len = max((len(path) for path in display_paths), default=0)
-
-            for file_path, display_path in zip(valid_files, display_paths):
-                content, size_str, lines, error = content_cache[file_path]
-                if content is not None:
-                    write_index_line(
-                        f"{display_path.ljust(max_path_len)} | SIZE: {size_str:>{max_size_len}}kb | LINES: {lines:>{max_lines_len}}"
-                    )
-                else:
-                    write_index_line(
-                        f"{display_path.ljust(max_path_len)} [Error reading file]"
-                    )
-            write_index_line(END_FILE_INDEX)
-            outfile.write("\n")
-            total_chars += 1
-
-        for index, (file_path, display_path) in enumerate(
-            zip(valid_files, display_paths), 1
-        ):
-            # Initialize variables
-            suffix = file_path.suffix.lower()
-            markers = _get_markers(suffix, display_path)  # Use display_path for markers
-
-            try:
-                # Write Start
-                s = f"{markers['start']}\n"
-                outfile.write(s)
-                total_chars += len(s)
-
-                # Write Content (from cache)
-                content, _, _, error = content_cache[file_path]
-                if error:
-                    raise error
-
-                outfile.write(content)
-                total_chars += len(content)
-                if content and not content.endswith(("\n", "\r")):
-                    outfile.write("\n")
-                    total_chars += 1
-
-                # Write End
-                s = f"{markers['end']}\n\n"
-                outfile.write(s)
-                total_chars += len(s)
-
-            except Exception as e:
-                error_msg = (
-                    "Cannot read file (binary or unsupported encoding)"
-                    if isinstance(e, UnicodeDecodeError)
-                    else str(e)
-                )
-                s = f"{markers['err_start']}\n{markers['err_msg_prefix']} {error_msg}{markers['err_msg_suffix']}\n{markers['err_end']}\n\n"
-                outfile.write(s)
-                total_chars += len(s)
-
-            if progress_callback:
-                progress_callback(index, total_files)
+    # Source Files Mode (extensions is empty list) uses paths relative to the
+    # common base of all selected files, Directory Mode uses full paths
+    if extensions == []:
+        common_path = os.path.commonpath([str(fp) for fp in valid_files])
+        display_paths = [os.path.relpath(str(fp), common_path) for fp in valid_files]
+    else:
+        display_paths = [str(fp) for fp in valid_files]
 
-    return total_chars // 4
+    return _write_bundle(
+        output_path, list(zip(valid_files, display_paths)), progress_callback
+    )
 
 
 def merge_source_folder(
@@ -565,134 +1039,35 @@ def merge_source_folder(
     if extensions is None:
         extensions = DEFAULT_EXTENSIONS
 
-    source_path = Path(source_dir).resolve()
+    source_dir_abs = os.path.realpath(source_dir)
     output_path = Path(output_file)
 
     # Collect matching files
-    matching_files = _collect_files(source_path, extensions, filters)
+    inodes: dict = {}
+    matching_files = _collect_files(Path(source_dir_abs), extensions, filters, inodes)
+
+    # Pre-calculate display paths and sort by path. Collected paths always
+    # start with the parent directory, so plain string slicing is enough.
+    source_parent = os.path.dirname(source_dir_abs)
+    source_name = os.path.basename(source_dir_abs)
+    parent_prefix = os.path.join(source_parent, "")
+    if source_parent == source_dir_abs and source_name:
+        # Handle root source_dir
+        display_prefix = f"{source_name}/"
+    else:
+        display_prefix = ""
 
-    # Pre-calculate display paths and sort by path
     file_entries = []
-    source_parent = source_path.parent
-
     for file_path in matching_files:
-        if source_parent == source_path:
-            # Handle root source_dir
-            rel_path = file_path.relative_to(source_path)
-            rel_path_display = (
-                f"./{source_path.name}/{rel_path}"
-                if source_path.name
-                else f"./{rel_path}"
-            )
-        else:
-            rel_path = file_path.relative_to(source_parent)
-            rel_path_display = f"./{rel_path}"
-
-        # Use POSIX paths
-        posix_rel_path = PurePosixPath(rel_path_display)
-        rel_path_display = str(posix_rel_path)
-        file_entries.append((file_path, rel_path_display))
-
-    file_entries.sort(key=lambda x: x[1])
-    total_files = len(file_entries)
-
-    # Calculate max path length for alignment
-    max_path_len = max((len(dp) for _, dp in file_entries), default=0)
-
-    # Pre-read files to generate index statistics and cache content
-    content_cache = {}
-    max_size_len = 0
-    max_lines_len = 0
-    for file_path, _ in file_entries:
-        try:
-            content = read_file_content(file_path)
-            size_kb = len(content.encode("utf-8")) / 1024
-            lines = content.count("\n") + 1
-            size_str = f"{size_kb:.1f}"
-            content_cache[file_path] = (content, size_str, lines, None)
-            max_size_len = max(max_size_len, len(size_str))
-            max_lines_len = max(max_lines_len, len(str(lines)))
-        except Exception as e:
-            content_cache[file_path] = (None, None, 0, e)
+        rel_path = str(file_path)[len(parent_prefix) :]
+        if os.sep != "/":
+            # Use POSIX paths
+            rel_path = rel_path.replace(os.sep, "/")
+        file_entries.append((file_path, display_prefix + rel_path))
 
-    # Determine bundle comment syntax
-    bundle_suffix = output_path.suffix.lower()
-    bundle_comment_char = COMMENT_SYNTAX.get(bundle_suffix, "#")
-    is_css_bundle = bundle_suffix == ".css"
-    total_chars = 0
-
-    with output_path.open("w", encoding="utf-8", newline="") as outfile:
-        if total_files > 0:
-            # Write File Index
-            def write_index_line(text: str):
-                """Writes a line to the index section with appropriate comments."""
-                nonlocal total_chars
-                line = ""
-                if is_css_bundle:
-                    line = f"{bundle_comment_char} {text} */\n"
-                else:
-                    line = f"{bundle_comment_char} {text}\n"
-                outfile.write(line)
-                total_chars += len(line)
-
-            write_index_line(START_FILE_INDEX)
-            write_index_line(f"Total Files: {total_files}")
-            write_index_line("")
-            for file_path, display_path in file_entries:
-                content, size_str, lines, error = content_cache[file_path]
-                if content is not None:
-                    write_index_line(
-                        f"{display_path.ljust(max_path_len)} | SIZE: {size_str:>{max_size_len}}kb | LINES: {lines:>{max_lines_len}}"
-                    )
-                else:
-                    write_index_line(
-                        f"{display_path.ljust(max_path_len)} [Error reading file]"
-                    )
-            write_index_line(END_FILE_INDEX)
-            outfile.write("\n")
-            total_chars += 1
+    file_entries.sort(key=operator.itemgetter(1))
 
-        for index, (file_path, rel_path_display) in enumerate(file_entries, 1):
-            # Initialize variables
-            suffix = file_path.suffix.lower()
-            markers = _get_markers(suffix, rel_path_display)
-
-            try:
-                # Write Start
-                s = f"{markers['start']}\n"
-                outfile.write(s)
-                total_chars += len(s)
-
-                # Write Content (from cache)
-                content, _, _, error = content_cache[file_path]
-                if error:
-                    raise error
-
-                outfile.write(content)
-                total_chars += len(content)
-                if content and not content.endswith(("\n", "\r")):
-                    outfile.write("\n")
-                    total_chars += 1
-
-                # Write End
-                s = f"{markers['end']}\n\n"
-                outfile.write(s)
-                total_chars += len(s)
-
-            except Exception as e:
-                error_msg = (
-                    "Cannot read file (binary or unsupported encoding)"
-                    if isinstance(e, UnicodeDecodeError)
-                    else str(e)
-                )
-                s = f"{markers['err_start']}\n{markers['err_msg_prefix']} {error_msg}{markers['err_msg_suffix']}\n{markers['err_end']}\n\n"
-                outfile.write(s)
-                total_chars += len(s)
-
-            if progress_callback:
-                progress_callback(index, total_files)
-
-    return total_chars // 4
+    return _write_bundle(output_path, file_entries, progress_callback, inodes)
 
 
 def split_source_code(
@@ -711,91 +1086,13 @@ def split_source_code(
         filters: List of filter rules to exclude files/directories.
         progress_callback: Optional callback for progress updates (current, total).
     """
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    source_path = Path(source_file)
-    with source_path.open("r", encoding="utf-8", newline="") as f:
-        content = f.read()
-    lines = content.splitlines(keepends=True)
-
-    total_lines = len(lines)
-    current_file = None
-    current_line = 0
-
-    while current_line < len(lines):
-        if progress_callback and current_line % 100 == 0:
-            progress_callback(current_line, total_lines)
+    base_path = os.path.abspath(output_dir)
+    os.makedirs(base_path, exist_ok=True)
 
-        line = lines[current_line]
-        stripped = line.strip()
-
-        # Check START marker
-        start_match = START_FILE_SPLIT.match(stripped)
-        if start_match:
-            if current_file:
-                current_file.close()
-                current_file = None
-
-            original_path_str = start_match.group(2)
-            target_path = _resolve_split_path(output_dir, original_path_str)
-
-            if target_path:
-                if _matches_filter(target_path, filters):
-                    print(f"Skipping filtered path: {original_path_str}")
-                    current_file = None
-                    current_line += 1
-                    continue
-
-                try:
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    target_path = _handle_file_collision(target_path, overwrite)
-                    current_file = target_path.open("w", encoding="utf-8", newline="")
-                except Exception as e:
-                    print(f"Error creating file {target_path}: {e}")
-                    current_file = None
-            else:
-                # Path resolution failed
-                current_file = None
-
-            # Skip START line
-            current_line += 1
-            continue
-
-        # Check END marker
-        end_match = END_FILE_SPLIT.match(stripped)
-        if end_match and current_file:
-            current_file.close()
-            current_file = None
-
-            # Skip END line
-            current_line += 1
-            if current_line < len(lines) and not lines[current_line].strip():
-                current_line += 1  # Skip empty line
-            continue
-
-        # Check ERROR START
-        error_start_match = START_ERROR_SPLIT.match(stripped)
-        if error_start_match:
-            current_line = _skip_error_section(lines, current_line)
-            continue
-
-        # Skip error messages
-        if ERROR_MSG_SPLIT.match(stripped):
-            current_line += 1
-            continue
-
-        # Write content
-        if current_file:
-            current_file.write(line)
-
-        current_line += 1
-
-    if current_file:
-        current_file.close()
-
-    if progress_callback:
-        progress_callback(total_lines, total_lines)
+    # The bundle is memory-mapped and processed as bytes: file contents are
+    # never decoded, and only the slices being written are copied
+    with open(source_file, "rb") as source, _map_file(source) as content:
+        _split_content(content, base_path, overwrite, filters, progress_callback)
 
 
 def apply_patch(
@@ -832,16 +1129,130 @@ def apply_patch(
 # GUI Helper Functions
 
 
+_dialog_background: Optional[str] = None
+# Named rich text fonts of the current Tk application, keyed by font name
+_rich_text_fonts: dict = {}
+
+
+def _load_tkinter() -> None:
+    """Imports Tkinter on first GUI use, so CLI runs never load it."""
+    global tk, filedialog, ttk, tkfont
+    import tkinter as tk
+    from tkinter import filedialog, ttk
+    from tkinter import font as tkfont
+
+
 def get_font_style() -> tuple:
     """Returns consistent font styling based on operating system.
 
     Returns:
         tuple: (font_family, font_size, font_style)
     """
-    font_family = "Segoe UI" if os.name == "nt" else "Helvetica"
-    font_size = 9 if os.name == "nt" else 10
-    font_style = (font_family, font_size)
-    return font_family, font_size, font_style
+    return FONT_FAMILY, FONT_SIZE, FONT_STYLE
+
+
+def _iter_rich_text_runs(message: str) -> Iterator[tuple]:
+    """Splits rich text markup into runs of text sharing the same styles.
+
+    Args:
+        message: Message containing <b>, <i>, <u>, <red>, <blue> and <green>
+            markup.
+
+    Yields:
+        tuple: (text, tags) where tags holds the active style tag names.
+            Consecutive runs never share the same tags.
+    """
+    active = set()
+    tags = ()
+    run = []
+    run_tags = ()
+    start = 0
+    # A trailing None flushes the text after the last tag
+    for match in [*RICH_TEXT_MARKUP.finditer(message), None]:
+        text = message[start : match.start() if match else len(message)]
+        if text:
+            # Only end a run when the set of active styles actually changes
+            if run and run_tags != tags:
+                yield "".join(run), run_tags
+                run.clear()
+            run.append(text)
+            run_tags = tags
+        if match is None:
+            break
+        style = RICH_TEXT_STYLES[match["name"]]
+        if match["close"]:
+            active.discard(style)
+        else:
+            active.add(style)
+        tags = tuple(tag for tag in RICH_TEXT_STYLES.values() if tag in active)
+        start = match.end()
+    if run:
+        yield "".join(run), run_tags
+
+
+@functools.lru_cache(maxsize=32)
+def _rich_text_height(message: str) -> int:
+    """Estimates the Text widget height needed for a rich text message.
+
+    Args:
+        message: Message containing rich text markup.
+
+    Returns:
+        int: Height in lines (~40 characters per line, min 3, max 10).
+    """
+    plain_length = len(RICH_TEXT_MARKUP.sub("", message))
+    return min(max(plain_length // 40 + 1, 3), 10)
+
+
+def get_rich_text_fonts(widget: tk.Misc) -> dict:
+    """Returns the named fonts used by rich text tags, created once per Tk app.
+
+    The fonts use fixed names, so a Tk interpreter that already defines them
+    reuses them, and a new interpreter gets fresh ones.
+
+    Args:
+        widget: Any widget of the Tk application the fonts belong to.
+
+    Returns:
+        dict: Font names keyed by the bold, italic and underline tag names.
+    """
+    existing = tkfont.names(widget)
+    fonts = {}
+    for tag, options in RICH_TEXT_FONTS.items():
+        name = f"SourceCodeBundler{tag.title()}"
+        if name not in existing:
+            # Keep the Font object alive, or Tk deletes the named font
+            _rich_text_fonts[name] = tkfont.Font(
+                widget, name=name, family=FONT_FAMILY, size=FONT_SIZE, **options
+            )
+        fonts[tag] = name
+    return fonts
+
+
+def get_dialog_background() -> str:
+    """Returns the themed frame background color, looked up once per session.
+
+    Returns:
+        str: Background color of ttk frames (defaults to #f0f0f0).
+    """
+    global _dialog_background
+    if _dialog_background is None:
+        _dialog_background = ttk.Style().lookup("TFrame", "background") or "#f0f0f0"
+    return _dialog_background
+
+
+def _window_geometry(window: tk.Misc) -> tuple:
+    """Reads a window's position and size with a single Tk query.
+
+    Args:
+        window: Window to measure.
+
+    Returns:
+        tuple: (x, y, width, height)
+    """
+    size, x, y = window.winfo_geometry().split("+")
+    width, height = size.split("x")
+    return int(x), int(y), int(width), int(height)
 
 
 def center_dialog(parent: tk.Widget, dialog: tk.Toplevel) -> None:
@@ -853,8 +1264,9 @@ def center_dialog(parent: tk.Widget, dialog: tk.Toplevel) -> None:
     """
     dialog.update_idletasks()
     if parent:
-        x = parent.winfo_x() + (parent.winfo_width() - dialog.winfo_reqwidth()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - dialog.winfo_reqheight()) // 2
+        parent_x, parent_y, parent_width, parent_height = _window_geometry(parent)
+        x = parent_x + (parent_width - dialog.winfo_reqwidth()) // 2
+        y = parent_y + (parent_height - dialog.winfo_reqheight()) // 2
         dialog.geometry(f"+{x}+{y}")
 
 
@@ -918,38 +1330,41 @@ def insert_checkbox_item(
 class GMessageBox:
     """Custom message box with consistent font sizing."""
 
+    # Icon glyph layers as (x, y, text, fill, font). Text characters are used
+    # for shapes to ensure antialiasing on all platforms.
+    # Circle: ● (U+25CF), Triangle: ▲ (U+25B2)
+    _ICONS = {
+        # Blue circle with 'i'
+        "information": (
+            (28, 28, "●", "#0078D7", (FONT_FAMILY, 72)),
+            (28, 28, "i", "white", (FONT_FAMILY, 22, "bold")),
+        ),
+        # Yellow triangle with '!'
+        "warning": (
+            (28, 28, "▲", "#FFC107", (FONT_FAMILY, 64)),
+            (28, 30, "!", "black", (FONT_FAMILY, 22, "bold")),
+        ),
+        # Red circle with 'X'
+        "error": (
+            (28, 28, "●", "#E81123", (FONT_FAMILY, 72)),
+            (28, 28, "X", "white", (FONT_FAMILY, 20, "bold")),
+        ),
+        # Blue circle with '?'
+        "question": (
+            (28, 28, "●", "#0078D7", (FONT_FAMILY, 72)),
+            (28, 28, "?", "white", (FONT_FAMILY, 22, "bold")),
+        ),
+    }
+
+    # Button sets as (text, return value, is default)
+    _OK_BUTTONS = [("OK", None, True)]
+    _YES_NO_BUTTONS = [("Yes", True, True), ("No", False, False)]
+
     @staticmethod
     def _draw_icon(canvas: tk.Canvas, icon: str) -> None:
         """Draws the specified icon onto the canvas."""
-        # Use text characters for shapes to ensure antialiasing on all platforms
-        # Circle: ● (U+25CF), Triangle: ▲ (U+25B2)
-
-        font_family, _, _ = get_font_style()
-
-        if icon == "information":
-            # Blue circle with 'i'
-            canvas.create_text(28, 28, text="●", fill="#0078D7", font=(font_family, 72))
-            canvas.create_text(
-                28, 28, text="i", fill="white", font=(font_family, 22, "bold")
-            )
-        elif icon == "warning":
-            # Yellow triangle with '!'
-            canvas.create_text(28, 28, text="▲", fill="#FFC107", font=(font_family, 64))
-            canvas.create_text(
-                28, 30, text="!", fill="black", font=(font_family, 22, "bold")
-            )
-        elif icon == "error":
-            # Red circle with 'X'
-            canvas.create_text(28, 28, text="●", fill="#E81123", font=(font_family, 72))
-            canvas.create_text(
-                28, 28, text="X", fill="white", font=(font_family, 20, "bold")
-            )
-        elif icon == "question":
-            # Blue circle with '?'
-            canvas.create_text(28, 28, text="●", fill="#0078D7", font=(font_family, 72))
-            canvas.create_text(
-                28, 28, text="?", fill="white", font=(font_family, 22, "bold")
-            )
+        for x, y, text, fill, font in GMessageBox._ICONS.get(icon, ()):
+            canvas.create_text(x, y, text=text, fill=fill, font=font)
 
     @staticmethod
     def _create_dialog(
@@ -962,8 +1377,9 @@ class GMessageBox:
     ) -> Any:
         # Default buttons if not provided
         if buttons is None:
-            buttons = [("OK", None, True)]
+            buttons = GMessageBox._OK_BUTTONS
 
+        _load_tkinter()
         dialog = tk.Toplevel()
         dialog.title(title)
         if parent:
@@ -977,10 +1393,10 @@ class GMessageBox:
         dialog.resizable(False, False)
 
         # Use consistent font styling
-        font_family, font_size, font_style = get_font_style()
+        _, _, font_style = get_font_style()
 
         # Get dialog background color
-        bg_color = ttk.Style().lookup("TFrame", "background") or "#f0f0f0"
+        bg_color = get_dialog_background()
 
         main_frame = ttk.Frame(dialog, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -999,27 +1415,10 @@ class GMessageBox:
             icon_canvas.pack(side=tk.LEFT, anchor=tk.N, padx=(0, 15))
             GMessageBox._draw_icon(icon_canvas, icon)
 
-        if rich_text:
+        # Messages without markup use the lighter plain label
+        if rich_text and RICH_TEXT_MARKUP.search(message):
             # Calculate appropriate height based on content
-            plain_message = message
-            for tag in [
-                "<b>",
-                "</b>",
-                "<i>",
-                "</i>",
-                "<u>",
-                "</u>",
-                "<red>",
-                "</red>",
-                "<blue>",
-                "</blue>",
-                "<green>",
-                "</green>",
-            ]:
-                plain_message = plain_message.replace(tag, "")
-
-            # Estimate height: ~40 characters per line, min 3 lines, max 10 lines
-            estimated_height = min(max(len(plain_message) // 40 + 1, 3), 10)
+            estimated_height = _rich_text_height(message)
 
             # Use Text widget for rich text support
             text_widget = tk.Text(
@@ -1041,91 +1440,15 @@ class GMessageBox:
             text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
             # Configure tags for formatting
-            text_widget.tag_configure("bold", font=(font_family, font_size, "bold"))
-            text_widget.tag_configure("italic", font=(font_family, font_size, "italic"))
-            text_widget.tag_configure(
-                "underline", font=(font_family, font_size, "normal", "underline")
-            )
+            for tag, font in get_rich_text_fonts(dialog).items():
+                text_widget.tag_configure(tag, font=font)
             text_widget.tag_configure("red", foreground="#E81123")
             text_widget.tag_configure("blue", foreground="#0078D7")
             text_widget.tag_configure("green", foreground="#107C10")
 
-            # Rich text markup parsing with state tracking
-            i = 0
-            bold_on = False
-            italic_on = False
-            underline_on = False
-            red_on = False
-            blue_on = False
-            green_on = False
-
-            while i < len(message):
-                if message.startswith("<b>", i):
-                    bold_on = True
-                    i += 3
-                    continue
-                elif message.startswith("</b>", i):
-                    bold_on = False
-                    i += 4
-                    continue
-                elif message.startswith("<i>", i):
-                    italic_on = True
-                    i += 3
-                    continue
-                elif message.startswith("</i>", i):
-                    italic_on = False
-                    i += 4
-                    continue
-                elif message.startswith("<u>", i):
-                    underline_on = True
-                    i += 3
-                    continue
-                elif message.startswith("</u>", i):
-                    underline_on = False
-                    i += 4
-                    continue
-                elif message.startswith("<red>", i):
-                    red_on = True
-                    i += 5
-                    continue
-                elif message.startswith("</red>", i):
-                    red_on = False
-                    i += 6
-                    continue
-                elif message.startswith("<blue>", i):
-                    blue_on = True
-                    i += 6
-                    continue
-                elif message.startswith("</blue>", i):
-                    blue_on = False
-                    i += 7
-                    continue
-                elif message.startswith("<green>", i):
-                    green_on = True
-                    i += 7
-                    continue
-                elif message.startswith("</green>", i):
-                    green_on = False
-                    i += 8
-                    continue
-                else:
-                    # Insert character with current formatting
-                    tags = []
-                    if bold_on:
-                        tags.append("bold")
-                    if italic_on:
-                        tags.append("italic")
-                    if underline_on:
-                        tags.append("underline")
-                    if red_on:
-                        tags.append("red")
-                    if blue_on:
-                        tags.append("blue")
-                    if green_on:
-                        tags.append("green")
-
-                    text_widget.insert(tk.END, message[i], tuple(tags) if tags else ())
-                    i += 1
+            # Insert each run of equally styled text in one call
+            for text, tags in _iter_rich_text_runs(message):
+                text_widget.insert(tk.END, text, tags)
 
             text_widget.config(state=tk.DISABLED)
         else:
@@ -1184,7 +1507,7 @@ class GMessageBox:
             title,
             message,
             parent,
-            [("OK", None, True)],
+            GMessageBox._OK_BUTTONS,
             icon="information",
             rich_text=rich_text,
         )
@@ -1200,7 +1523,7 @@ class GMessageBox:
             title,
             message,
             parent,
-            [("OK", None, True)],
+            GMessageBox._OK_BUTTONS,
             icon="warning",
             rich_text=rich_text,
         )
@@ -1216,7 +1539,7 @@ class GMessageBox:
             title,
             message,
             parent,
-            [("OK", None, True)],
+            GMessageBox._OK_BUTTONS,
             icon="error",
             rich_text=rich_text,
         )
@@ -1233,7 +1556,7 @@ class GMessageBox:
             title,
             message,
             parent,
-            [("Yes", True, True), ("No", False, False)],
+            GMessageBox._YES_NO_BUTTONS,
             icon=icon if icon in ["warning", "error", "information"] else "question",
             rich_text=rich_text,
         )
@@ -1241,6 +1564,7 @@ class GMessageBox:
     @staticmethod
     def askpassword(title: str, message: str) -> Optional[str]:
         """Show password input dialog with secure entry field."""
+        _load_tkinter()
         dialog = tk.Toplevel()
         root = dialog.master
         dialog.title(title)
@@ -1386,8 +1710,9 @@ def _create_rule_input_dialog(
 
     # Center dialog relative to parent
     parent.update_idletasks()
-    x = parent.winfo_x() + (parent.winfo_width() // 2) - (300 // 2)
-    y = parent.winfo_y() + (parent.winfo_height() // 2) - (150 // 2)
+    parent_x, parent_y, parent_width, parent_height = _window_geometry(parent)
+    x = parent_x + (parent_width // 2) - (300 // 2)
+    y = parent_y + (parent_height // 2) - (150 // 2)
     input_dialog.geometry(f"300x150+{x}+{y}")
 
     content_frame = ttk.Frame(input_dialog, padding=10)
@@ -1426,51 +1751,82 @@ def update_progress(
     current: int,
     total: int,
     progress_var: tk.DoubleVar,
-    root: tk.Tk,
 ) -> None:
     """Update progress bar based on current progress.
 
+    The bar is redrawn by the Tk event loop, which keeps running while
+    operations execute in a worker thread.
+
     Args:
         current: Current progress value.
         total: Total value for 100% completion.
         progress_var: Progress bar variable.
-        root: Tkinter root window.
     """
     if total > 0:
         percentage = (current / total) * 100
-        progress_var.set(percentage)
-        root.update_idletasks()
+        # Update only on visible steps to avoid needless redraws
+        previous = progress_var.get()
+        if (
+            percentage >= 100
+            or percentage < previous
+            or percentage - previous >= PROGRESS_STEP
+        ):
+            progress_var.set(percentage)
 
 
 def toggle_checkbox(
     event: tk.Event,
     tree: ttk.Treeview,
-    extension_vars: dict,
+    extension_state: dict,
 ) -> None:
     """Toggle the checkbox state for the selected extension.
 
     Args:
         event: Mouse click event.
         tree: Treeview widget containing extensions.
-        extension_vars: Dictionary of extension BooleanVars.
+        extension_state: Dictionary mapping extensions to their enabled state.
     """
     item_id = tree.identify_row(event.y)
     if not item_id:
         return
 
     ext = tree.item(item_id, "values")[0]
-    current_val = extension_vars[ext].get()
-    new_val = not current_val
-    extension_vars[ext].set(new_val)
+    new_val = not extension_state[ext]
+    extension_state[ext] = new_val
 
     char = get_checkbox_char(new_val)
     tree.item(item_id, text=f" {char} {ext}")
 
 
+def _push_history(history: list, path: str) -> bool:
+    """Moves a path to the front of a history list, keeping HISTORY_SIZE entries.
+
+    Args:
+        history: History list, most recent entry first.
+        path: Path to record.
+
+    Returns:
+        bool: True if the history changed.
+    """
+    # Re-running with the most recent path leaves the history as it is
+    if history[:1] == [path] and len(history) <= HISTORY_SIZE:
+        return False
+    try:
+        index = history.index(path)
+    except ValueError:
+        history.insert(0, path)
+    else:
+        # Shift only the entries in front of the path instead of removing it
+        history[1 : index + 1] = history[:index]
+        history[0] = path
+    del history[HISTORY_SIZE:]
+    return True
+
+
 def update_history(
     src: str,
     dst: str,
-    operation_mode: tk.StringVar,
+    mode: str,
     source_entry: ttk.Combobox,
     destination_entry: ttk.Combobox,
     merge_source_history: list,
@@ -1485,7 +1841,7 @@ def update_history(
     Args:
         src: Source path.
         dst: Destination path.
-        operation_mode: StringVar indicating operation mode.
+        mode: Operation mode the paths were used in (merge, split or patch).
         source_entry: Source combobox widget.
         destination_entry: Destination combobox widget.
         merge_source_history: Merge mode source history list.
@@ -1495,7 +1851,6 @@ def update_history(
         patch_source_history: Patch mode source history list.
         patch_dest_history: Patch mode destination history list.
     """
-    mode = operation_mode.get()
     if mode == "split":
         s_hist = split_source_history
         d_hist = split_dest_history
@@ -1506,17 +1861,12 @@ def update_history(
         s_hist = merge_source_history
         d_hist = merge_dest_history
 
-    if src in s_hist:
-        s_hist.remove(src)
-    s_hist.insert(0, src)
-    del s_hist[10:]
-    source_entry["values"] = s_hist
+    # Only refresh the dropdowns whose history changed
+    if _push_history(s_hist, src):
+        source_entry["values"] = s_hist
 
-    if dst in d_hist:
-        d_hist.remove(dst)
-    d_hist.insert(0, dst)
-    del d_hist[10:]
-    destination_entry["values"] = d_hist
+    if _push_history(d_hist, dst):
+        destination_entry["values"] = d_hist
 
 
 # ==============================================================================
@@ -1593,6 +1943,7 @@ def run_cli() -> None:
 
 def run_gui() -> None:
     """Initializes and runs the graphical user interface."""
+    _load_tkinter()
     root = tk.Tk()
     root.title("Source Code Bundler")
 
@@ -1634,9 +1985,9 @@ def run_gui() -> None:
     source_files_mode = tk.BooleanVar(value=config.get("source_files_mode", False))
     progress_var = tk.DoubleVar()
     extensions_config = config.get("extensions", {})
-    extension_vars = {
-        ext: tk.BooleanVar(value=extensions_config.get(ext, True))
-        for ext in DEFAULT_EXTENSIONS
+    # Plain booleans: only the Options dialog needs to display them
+    extension_state = {
+        ext: extensions_config.get(ext, True) for ext in DEFAULT_EXTENSIONS
     }
 
     merge_source_history = config.get("merge_source_history", [])
@@ -1712,9 +2063,7 @@ def run_gui() -> None:
         dialog.minsize(450, 350)
 
         # Create local copies of extension states
-        local_extension_vars = {
-            ext: extension_vars[ext].get() for ext in DEFAULT_EXTENSIONS
-        }
+        local_extension_vars = dict(extension_state)
 
         # Create local copy of filter rules
         local_filter_rules = [f.copy() for f in filter_rules]
@@ -1738,17 +2087,20 @@ def run_gui() -> None:
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+        # Maps tree item IDs to extensions, so clicks need no item lookup
+        tree_extensions = {}
         for ext in DEFAULT_EXTENSIONS:
             is_checked = local_extension_vars[ext]
-            insert_checkbox_item(tree, ext, (ext,), is_checked)
+            item_id = insert_checkbox_item(tree, ext, (ext,), is_checked)
+            tree_extensions[item_id] = ext
 
         def toggle_checkbox_local(event: tk.Event) -> None:
             """Toggle the checkbox state for the selected extension in local state."""
             item_id = tree.identify_row(event.y)
-            if not item_id:
+            ext = tree_extensions.get(item_id)
+            if ext is None:
                 return
 
-            ext = tree.item(item_id, "values")[0]
             current_val = local_extension_vars[ext]
             new_val = not current_val
             local_extension_vars[ext] = new_val
@@ -1858,10 +2210,16 @@ def run_gui() -> None:
         filter_tree.bind("<Button-3>", show_context_menu)
         filter_tree.bind("<Escape>", lambda e: context_menu.unpost())
 
-        local_filter_rules.sort(key=lambda x: x.get("rule", "").lower())
-        for f in local_filter_rules:
-            char = get_checkbox_char(f.get("active", True))
-            filter_tree.insert("", "end", values=(char, f["rule"]))
+        def populate_filter_tree() -> None:
+            """Fills the filter tree with the local filter rules, sorted by rule."""
+            # Clear the tree in one Tk call; rows are only drawn once idle
+            filter_tree.delete(*filter_tree.get_children())
+            local_filter_rules.sort(key=lambda x: x.get("rule", "").lower())
+            for f in local_filter_rules:
+                char = get_checkbox_char(f.get("active", True))
+                filter_tree.insert("", "end", values=(char, f["rule"]))
+
+        populate_filter_tree()
 
         def open_project_file():
             """Opens a JSON project file and loads its settings."""
@@ -1927,19 +2285,15 @@ def run_gui() -> None:
 
                     # Refresh UI
                     # Clear and repopulate extensions tree
-                    for item in tree.get_children():
-                        tree.delete(item)
+                    tree.delete(*tree_extensions)
+                    tree_extensions.clear()
                     for ext in DEFAULT_EXTENSIONS:
                         is_checked = local_extension_vars[ext]
-                        insert_checkbox_item(tree, ext, (ext,), is_checked)
+                        item_id = insert_checkbox_item(tree, ext, (ext,), is_checked)
+                        tree_extensions[item_id] = ext
 
                     # Clear and repopulate filters tree
-                    for item in filter_tree.get_children():
-                        filter_tree.delete(item)
-                    local_filter_rules.sort(key=lambda x: x.get("rule", "").lower())
-                    for f in local_filter_rules:
-                        char = get_checkbox_char(f.get("active", True))
-                        filter_tree.insert("", "end", values=(char, f["rule"]))
+                    populate_filter_tree()
 
                 except Exception as e:
                     GMessageBox.showerror(
@@ -1999,9 +2353,8 @@ def run_gui() -> None:
 
         def apply_options():
             """Saves changes to global state and closes the options dialog."""
-            # Update global extension vars
-            for ext in DEFAULT_EXTENSIONS:
-                extension_vars[ext].set(local_extension_vars[ext])
+            # Update global extension state
+            extension_state.update(local_extension_vars)
 
             # Update global filter rules
             filter_rules.clear()
@@ -2037,6 +2390,60 @@ def run_gui() -> None:
         # Center dialog
         center_dialog(root, dialog)
 
+    def run_in_background(task: Callable, on_success: Callable) -> None:
+        """Runs a long operation in a worker thread while the UI stays live.
+
+        The worker only posts progress to a queue. The queue is drained, and
+        the outcome reported, by a timer on the UI thread, so Tk is never
+        touched from the worker.
+
+        Args:
+            task: Callable taking a progress callback; runs off the UI thread.
+            on_success: Called on the UI thread with the task's return value.
+        """
+        progress_queue = queue.SimpleQueue()
+        outcome = {}
+
+        def worker() -> None:
+            try:
+                outcome["result"] = task(lambda c, t: progress_queue.put((c, t)))
+            except Exception as error:
+                outcome["error"] = error
+
+        def drain() -> None:
+            latest = None
+            try:
+                while True:
+                    latest = progress_queue.get_nowait()
+            except queue.Empty:
+                pass
+            if latest:
+                update_progress(*latest, progress_var)
+
+            if thread.is_alive():
+                root.after(PROGRESS_POLL_MS, drain)
+                return
+
+            execute_button.config(state="normal")
+            options_button.config(state="normal")
+            for button in mode_buttons:
+                button.config(state="normal")
+            if "error" in outcome:
+                GMessageBox.showerror("Operation Failed", str(outcome["error"]))
+            else:
+                on_success(outcome["result"])
+            progress_var.set(0)
+
+        # Not a daemon: closing the window must not cut a bundle short
+        thread = threading.Thread(target=worker)
+        execute_button.config(state="disabled")
+        options_button.config(state="disabled")
+        # Switching mode mid-run would change the fields the run reports on
+        for button in mode_buttons:
+            button.config(state="disabled")
+        thread.start()
+        root.after(PROGRESS_POLL_MS, drain)
+
     def run_operation() -> None:
         """Executes merge, split, or patch operation based on current mode."""
         src = source_var.get()
@@ -2052,6 +2459,23 @@ def run_gui() -> None:
 
         progress_var.set(0)
 
+        def finish(message: str) -> None:
+            """Records the paths in the history and reports success."""
+            update_history(
+                src,
+                dst,
+                mode,
+                source_entry,
+                destination_entry,
+                merge_source_history,
+                merge_dest_history,
+                split_source_history,
+                split_dest_history,
+                patch_source_history,
+                patch_dest_history,
+            )
+            GMessageBox.showinfo("Operation Complete", message)
+
         try:
             if mode == "split":
                 # Validate paths for split mode
@@ -2067,30 +2491,18 @@ def run_gui() -> None:
                     )
                     return
 
-                split_source_code(
-                    src,
-                    dst,
-                    overwrite=overwrite_mode.get(),
-                    filters=filter_rules,
-                    progress_callback=lambda c, t: update_progress(
-                        c, t, progress_var, root
+                # Tk variables are read here, never from the worker thread
+                overwrite = overwrite_mode.get()
+                split_filters = [f.copy() for f in filter_rules]
+                run_in_background(
+                    lambda progress: split_source_code(
+                        src,
+                        dst,
+                        overwrite=overwrite,
+                        filters=split_filters,
+                        progress_callback=progress,
                     ),
-                )
-                update_history(
-                    src,
-                    dst,
-                    operation_mode,
-                    source_entry,
-                    destination_entry,
-                    merge_source_history,
-                    merge_dest_history,
-                    split_source_history,
-                    split_dest_history,
-                    patch_source_history,
-                    patch_dest_history,
-                )
-                GMessageBox.showinfo(
-                    "Operation Complete", f"Successfully split source code into:\n{dst}"
+                    lambda _: finish(f"Successfully split source code into:\n{dst}"),
                 )
             elif mode == "patch":
                 # Validate paths for patch mode
@@ -2106,28 +2518,9 @@ def run_gui() -> None:
                     )
                     return
 
-                apply_patch(
-                    src,
-                    dst,
-                    progress_callback=lambda c, t: update_progress(
-                        c, t, progress_var, root
-                    ),
-                )
-                update_history(
-                    src,
-                    dst,
-                    operation_mode,
-                    source_entry,
-                    destination_entry,
-                    merge_source_history,
-                    merge_dest_history,
-                    split_source_history,
-                    split_dest_history,
-                    patch_source_history,
-                    patch_dest_history,
-                )
-                GMessageBox.showinfo(
-                    "Operation Complete", "Patch applied successfully."
+                run_in_background(
+                    lambda progress: apply_patch(src, dst, progress_callback=progress),
+                    lambda _: finish("Patch applied successfully."),
                 )
             else:
                 # Handle both directory and multiple file sources for merge mode
@@ -2175,58 +2568,46 @@ def run_gui() -> None:
                         return
 
                 active_extensions = [
-                    ext for ext, var in extension_vars.items() if var.get()
+                    ext for ext, enabled in extension_state.items() if enabled
                 ]
 
                 if source_files_mode.get():
                     # Use merge_source_files for multiple files
                     # In Source Files Mode, ignore extension and filter restrictions
                     source_files = src.split(";")
-                    tokens = merge_source_files(
-                        source_files,
-                        dst,
-                        extensions=None,  # Ignore extension restrictions
-                        filters=None,  # Ignore filter rules
-                        progress_callback=lambda c, t: update_progress(
-                            c, t, progress_var, root
-                        ),
-                    )
+
+                    def merge_task(progress: Callable) -> int:
+                        return merge_source_files(
+                            source_files,
+                            dst,
+                            extensions=None,  # Ignore extension restrictions
+                            filters=None,  # Ignore filter rules
+                            progress_callback=progress,
+                        )
+
                 else:
                     # Use merge_source_folder for directory
-                    tokens = merge_source_folder(
-                        src,
-                        dst,
-                        extensions=active_extensions,
-                        filters=filter_rules,
-                        progress_callback=lambda c, t: update_progress(
-                            c, t, progress_var, root
-                        ),
-                    )
-                update_history(
-                    src,
-                    dst,
-                    operation_mode,
-                    source_entry,
-                    destination_entry,
-                    merge_source_history,
-                    merge_dest_history,
-                    split_source_history,
-                    split_dest_history,
-                    patch_source_history,
-                    patch_dest_history,
-                )
-                GMessageBox.showinfo(
-                    "Operation Complete",
-                    f"Successfully bundled source code into:\n{dst}\n\nEstimated Tokens: {tokens}",
+                    merge_filters = [f.copy() for f in filter_rules]
+
+                    def merge_task(progress: Callable) -> int:
+                        return merge_source_folder(
+                            src,
+                            dst,
+                            extensions=active_extensions,
+                            filters=merge_filters,
+                            progress_callback=progress,
+                        )
+
+                run_in_background(
+                    merge_task,
+                    lambda tokens: finish(
+                        f"Successfully bundled source code into:\n{dst}\n\nEstimated Tokens: {tokens}"
+                    ),
                 )
-        except ValueError as ve:
-            # Handle specific validation errors from merge functions
-            GMessageBox.showerror("Operation Failed", str(ve))
         except Exception as error:
-            # Handle other unexpected errors
+            # Handle unexpected errors while validating
             GMessageBox.showerror("Operation Failed", str(error))
-
-        progress_var.set(0)
+            progress_var.set(0)
 
     def update_source_label() -> None:
         """Updates source label based on operation mode and source files mode."""
@@ -2320,29 +2701,34 @@ def run_gui() -> None:
     mode_frame = ttk.Frame(input_frame)
     mode_frame.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=10)
 
-    ttk.Radiobutton(
+    merge_mode_button = ttk.Radiobutton(
         mode_frame,
         text="Merge Mode",
         variable=operation_mode,
         value="merge",
         command=toggle_operation_mode,
-    ).pack(side=tk.LEFT, padx=(0, 10))
+    )
+    merge_mode_button.pack(side=tk.LEFT, padx=(0, 10))
 
-    ttk.Radiobutton(
+    split_mode_button = ttk.Radiobutton(
         mode_frame,
         text="Split Mode",
         variable=operation_mode,
         value="split",
         command=toggle_operation_mode,
-    ).pack(side=tk.LEFT, padx=(0, 10))
+    )
+    split_mode_button.pack(side=tk.LEFT, padx=(0, 10))
 
-    ttk.Radiobutton(
+    patch_mode_button = ttk.Radiobutton(
         mode_frame,
         text="Patch Mode",
         variable=operation_mode,
         value="patch",
         command=toggle_operation_mode,
-    ).pack(side=tk.LEFT)
+    )
+    patch_mode_button.pack(side=tk.LEFT)
+
+    mode_buttons = [merge_mode_button, split_mode_button, patch_mode_button]
 
     source_files_check = ttk.Checkbutton(
         input_frame,
@@ -2374,7 +2760,7 @@ def run_gui() -> None:
     def on_closing() -> None:
         """Saves configuration and closes the application."""
         config["geometry"] = root.geometry()
-        config["extensions"] = {ext: var.get() for ext, var in extension_vars.items()}
+        config["extensions"] = extension_state
         config["overwrite_mode"] = overwrite_mode.get()
         config["source_files_mode"] = source_files_mode.get()
         config["merge_source_history"] = merge_source_history
@@ -2384,7 +2770,9 @@ def run_gui() -> None:
         config["patch_source_history"] = patch_source_history
         config["patch_dest_history"] = patch_dest_history
         config["filters"] = filter_rules
-        save_config(config)
+        # Save in the background so the window closes at once; the thread is
+        # not a daemon, so the interpreter still waits for the write to finish
+        threading.Thread(target=save_config, args=(config,)).start()
         root.destroy()
 
     button_frame = ttk.Frame(action_frame)
@@ -212,6 +212,21 @@ class TestSourceCodeBundler(unittest.TestCase):
         self.assertIn("Test.Cpp", content)
         self.assertIn("STYLE.CSS", content)
 
+    def test_extensions_without_leading_dot(self):
+        """Test that extensions given without a leading dot still match."""
+        self._create_test_file("main.py", "print('hello')")
+        self._create_test_file("notes.md", "# Notes")
+
+        source_code_bundler.merge_source_folder(
+            self.src_dir, self.bundle_file, extensions=["py", "MD"]
+        )
+
+        with open(self.bundle_file, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        self.assertIn("main.py", content)
+        self.assertIn("notes.md", content)
+
     def test_merge_empty_directory(self):
         """Test merging an empty directory produces an empty file."""
         source_code_bundler.merge_source_folder(
@@ -269,6 +284,24 @@ class TestSourceCodeBundler(unittest.TestCase):
             content = f.read()
         self.assertIn(f"/* {source_code_bundler.START_FILE_INDEX} */", content)
 
+    def test_bundle_index_line_counts(self):
+        """Test that the file index counts lines without an extra trailing line."""
+        self._create_test_file("a_terminated.py", "x = 1\ny = 2\n")
+        self._create_test_file("b_unterminated.py", "x = 1\ny = 2")
+        self._create_test_file("c_empty.py", "")
+
+        bundle = os.path.join(self.test_dir, "bundle.txt")
+        source_code_bundler.merge_source_folder(
+            self.src_dir, bundle, extensions=[".py"]
+        )
+        with open(bundle, "r", encoding="utf-8") as f:
+            index_lines = [line for line in f if "| LINES:" in line]
+
+        self.assertEqual(len(index_lines), 3)
+        self.assertTrue(index_lines[0].rstrip().endswith("LINES: 2"))
+        self.assertTrue(index_lines[1].rstrip().endswith("LINES: 2"))
+        self.assertTrue(index_lines[2].rstrip().endswith("LINES: 0"))
+
     def test_css_comment_closing_correctness(self):
         """Test that CSS markers are proper CSS comments (opened and closed)."""
         self._create_test_file("test.css", "body { color: red; }")
@@ -559,6 +592,22 @@ class TestSourceCodeBundler(unittest.TestCase):
         # The content should be converted to UTF-8 in the bundle
         self.assertIn("café", content)
 
+    def test_encoding_fallback_in_large_file(self):
+        """Test that invalid UTF-8 past the first decode chunk still falls back."""
+        padding = b"x" * (source_code_bundler.DECODE_CHUNK_SIZE + 100)
+        file_path = os.path.join(self.src_dir, "large_latin1.txt")
+        with open(file_path, "wb") as f:
+            f.write(padding + b"\ncaf\xe9\n")
+
+        source_code_bundler.merge_source_folder(
+            self.src_dir, self.bundle_file, extensions=[".txt"]
+        )
+
+        with open(self.bundle_file, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        self.assertIn("\ncafé\n", content)
+
     def test_error_markers_defined_before_exception_robust(self):
         """Test error markers are defined before any exception can occur."""
         if os.name == "nt":  # Skip on Windows
@@ -759,6 +808,24 @@ class TestSourceCodeBundler(unittest.TestCase):
         self.assertNotIn(".hidden.py", content)
         self.assertNotIn(".hidden_dir", content)
 
+    def test_source_directory_inside_hidden_directory(self):
+        """Test only path components below the source directory are checked for hidden names."""
+        hidden_root = os.path.join(self.test_dir, ".cache", "project")
+        os.makedirs(os.path.join(hidden_root, "pkg"))
+        with open(os.path.join(hidden_root, "pkg", "mod.py"), "w") as f:
+            f.write("# Module")
+
+        source_code_bundler.merge_source_folder(
+            hidden_root, self.bundle_file, extensions=[".py"]
+        )
+
+        with open(self.bundle_file, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        self.assertIn(
+            f"{source_code_bundler.START_FILE_MERGE} project/pkg/mod.py", content
+        )
+
     # ============================================================================
     # Content Preservation Tests
     # ============================================================================
@@ -891,6 +958,40 @@ class TestSourceCodeBundler(unittest.TestCase):
                 f"Line ending mismatch for '{filename}'",
             )
 
+    def test_split_cr_only_bundle(self):
+        """Test splitting a bundle that uses only CR line endings."""
+        test_files = {
+            "first.py": "Line 1\rLine 2\r",
+            "second.py": "Other\r",
+        }
+
+        for filename, content in test_files.items():
+            self._create_test_file(filename, content)
+
+        source_code_bundler.merge_source_folder(
+            self.src_dir, self.bundle_file, extensions=[".py"]
+        )
+
+        # Convert the whole bundle, markers included, to CR line endings
+        with open(self.bundle_file, "rb") as f:
+            bundle = f.read()
+        with open(self.bundle_file, "wb") as f:
+            f.write(bundle.replace(b"\r\n", b"\n").replace(b"\n", b"\r"))
+
+        source_code_bundler.split_source_code(self.bundle_file, self.output_dir)
+
+        src_dirname = os.path.basename(self.src_dir)
+        self.assertEqual(os.listdir(self.output_dir), [src_dirname])
+        for filename, original_content in test_files.items():
+            restored_path = os.path.join(self.output_dir, src_dirname, filename)
+            self.assertTrue(
+                os.path.exists(restored_path),
+                f"File '{filename}' from a CR-only bundle was not restored",
+            )
+
+            with open(restored_path, "r", encoding="utf-8", newline="") as f:
+                self.assertEqual(f.read(), original_content)
+
     # ============================================================================
     # Special Character and Unicode Tests
     # ============================================================================
@@ -1108,6 +1209,35 @@ class TestSourceCodeBundler(unittest.TestCase):
             if temp_config and os.path.exists(temp_config):
                 os.remove(temp_config)
 
+    def test_save_config_failure_removes_temp_file(self):
+        """Test that a failed configuration save leaves no temporary file."""
+        original_config_file = source_code_bundler.CONFIG_FILE
+        source_code_bundler.CONFIG_FILE = os.path.join(self.test_dir, "config.json")
+        try:
+            # Objects that JSON cannot serialize make json.dump fail mid-write
+            source_code_bundler.save_config({"broken": object()})
+
+            self.assertFalse(os.path.exists(source_code_bundler.CONFIG_FILE))
+            self.assertFalse(
+                os.path.exists(f"{source_code_bundler.CONFIG_FILE}.tmp"),
+                "Temporary configuration file was left behind",
+            )
+        finally:
+            source_code_bundler.CONFIG_FILE = original_config_file
+
+    def test_history_most_recent_first(self):
+        """Test that history keeps the most recent paths first without duplicates."""
+        history = [f"path{i}" for i in range(source_code_bundler.HISTORY_SIZE)]
+
+        self.assertFalse(source_code_bundler._push_history(history, "path0"))
+        self.assertTrue(source_code_bundler._push_history(history, "path3"))
+        self.assertEqual(history[:5], ["path3", "path0", "path1", "path2", "path4"])
+
+        self.assertTrue(source_code_bundler._push_history(history, "new"))
+        self.assertEqual(history[:2], ["new", "path3"])
+        self.assertEqual(len(history), source_code_bundler.HISTORY_SIZE)
+        self.assertNotIn(f"path{source_code_bundler.HISTORY_SIZE - 1}", history)
+
     # ============================================================================
     # Patch Mode Tests
     # ============================================================================
@@ -1267,6 +1397,23 @@ class TestSourceCodeBundler(unittest.TestCase):
         finally:
             root.destroy()
 
+    def test_rich_text_runs(self):
+        """Test that rich text markup is split into equally styled runs."""
+        runs = list(
+            source_code_bundler._iter_rich_text_runs(
+                "Plain <b>bold <red>alert</red></b> <x>mid</i>end</u>"
+            )
+        )
+        self.assertEqual(
+            runs,
+            [
+                ("Plain ", ()),
+                ("bold ", ("bold",)),
+                ("alert", ("bold", "red")),
+                (" <x>midend", ()),
+            ],
+        )
+
     # ============================================================================
     # CLI Tests
     # ============================================================================